@@ -0,0 +1,106 @@
+"""Measure the memory retained per polled host.
+
+Polls many hosts once and reports the resident set size (RSS) and the
+Python allocations still held afterwards, with and without keeping the
+decoded data and with and without interning the sensor names. Every
+measurement runs in a fresh process so the RSS is not skewed by memory
+freed, but not returned, by an earlier run, or by tracemalloc itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import os
+import resource
+import subprocess
+import sys
+import tracemalloc
+from itertools import product
+
+from payload import make_response, mock_client
+
+import glances_api
+from glances_api import Glances, arrays
+
+
+def resident_size() -> int:
+    """Return the resident set size of the process in bytes."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak instead of current size, in KiB on Linux and bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+async def retained_per_host(hosts: int, keep_data: bool, trace: bool) -> float:
+    """Poll the hosts and return the retained memory per host in KiB.
+
+    This is the RSS or, if ``trace`` is set, the Python allocations.
+    """
+    httpx_client = mock_client(make_response())
+    gc.collect()
+    before = resident_size()
+    if trace:
+        tracemalloc.start()
+    clients = [
+        Glances(
+            host=f"host{number}",
+            version=4,
+            httpx_client=httpx_client,
+            keep_data=keep_data,
+        )
+        for number in range(hosts)
+    ]
+    results = [await client.get_ha_sensor_data() for client in clients]
+    gc.collect()
+    if trace:
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    else:
+        size = resident_size() - before
+    await httpx_client.aclose()
+    assert len(results) == hosts
+    return size / hosts / 1024
+
+
+def run(hosts: int, keep_data: bool, intern: bool, trace: bool) -> None:
+    """Measure a single configuration and print the result."""
+    if not intern:
+        glances_api.intern = arrays.intern = lambda name: name  # type: ignore[assignment]
+    print(asyncio.run(retained_per_host(hosts, keep_data, trace)))
+
+
+def measure(hosts: int, keep_data: bool, intern: bool, trace: bool) -> float:
+    """Measure a single configuration in a fresh process."""
+    command = [sys.executable, __file__, "--hosts", str(hosts)]
+    command += ["--run", str(keep_data), str(intern), str(trace)]
+    output = subprocess.run(command, capture_output=True, check=True, text=True)
+    return float(output.stdout)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hosts", type=int, default=200)
+    parser.add_argument("--run", nargs=3, metavar=("KEEP_DATA", "INTERN", "TRACE"))
+    args = parser.parse_args()
+
+    if args.run:
+        run(args.hosts, *(value == "True" for value in args.run))
+        return
+
+    for keep_data, intern in product((True, False), repeat=2):
+        rss = measure(args.hosts, keep_data, intern, False)
+        allocated = measure(args.hosts, keep_data, intern, True)
+        print(
+            f"keep_data={keep_data!s:5} intern={intern!s:5}: "
+            f"RSS {rss:7.1f} KiB, allocated {allocated:7.1f} KiB per host"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measure event loop lag and throughput with and without an executor.
+
+Polls many hosts at once while a ticker measures how late the event
+loop wakes it up. The responses come from a mock transport, so the
+time is spent decoding and transforming the data.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from payload import make_response, mock_client
+
+from glances_api import Glances
+
+TICK = 0.001
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late the event loop runs a sleeping task."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def run(hosts: int, rounds: int, executor: Executor | None) -> None:
+    """Poll the hosts and print the results."""
+    httpx_client = mock_client(make_response(cpus=128, processes=600))
+    clients = [
+        Glances(
+            host=f"host{number}",
+            version=4,
+            httpx_client=httpx_client,
+            # Recommended with a process pool, it avoids pickling the data
+            keep_data=False,
+            executor=executor,
+        )
+        for number in range(hosts)
+    ]
+    # Warm up the workers
+    await asyncio.gather(*(client.get_ha_sensor_data() for client in clients))
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(lags, stop))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(client.get_ha_sensor_data() for client in clients))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker_task
+    await httpx_client.aclose()
+
+    lags.sort()
+    name = type(executor).__name__ if executor else "event loop"
+    print(
+        f"{name:>20}: {hosts * rounds / elapsed:7.1f} polls/s, "
+        f"loop lag median {statistics.median(lags) * 1000:6.2f} ms, "
+        f"p99 {lags[int(len(lags) * 0.99)] * 1000:6.2f} ms, "
+        f"max {lags[-1] * 1000:6.2f} ms"
+    )
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hosts", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    await run(args.hosts, args.rounds, None)
+    with ThreadPoolExecutor(args.workers) as executor:
+        await run(args.hosts, args.rounds, executor)
+    with ProcessPoolExecutor(args.workers) as executor:
+        await run(args.hosts, args.rounds, executor)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""Synthetic Glances responses for the benchmarks."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+
+
+def make_response(cpus: int = 64, processes: int = 400) -> dict[str, Any]:
+    """Create a response of the 'all' endpoint of a busy Glances v4 server."""
+    return {
+        "cpu": {"total": 10.6, "user": 7.6, "system": 2.1, "idle": 88.8},
+        "percpu": [
+            {
+                "key": "cpu_number",
+                "cpu_number": number,
+                "total": 22.1,
+                "user": 7.6,
+                "system": 12.4,
+                "idle": 77.9,
+                "iowait": 0.2,
+                "time_since_update": 1.0,
+            }
+            for number in range(cpus)
+        ],
+        "fs": [
+            {
+                "key": "mnt_point",
+                "device_name": f"/dev/sda{number}",
+                "fs_type": "ext4",
+                "mnt_point": f"/mnt/disk{number}",
+                "size": 511320748032,
+                "used": 32910458880,
+                "free": 457917374464,
+                "percent": 6.7,
+            }
+            for number in range(8)
+        ],
+        "mem": {
+            "total": 3976318976,
+            "percent": 27.6,
+            "used": 1097981952,
+            "free": 2878337024,
+        },
+        "load": {"min1": 0.5, "min5": 0.6, "min15": 0.7, "cpucore": cpus},
+        "network": [
+            {
+                "key": "interface_name",
+                "interface_name": f"eth{number}",
+                "is_up": True,
+                "speed": 1048576000,
+                "time_since_update": 1.0,
+                "bytes_recv_rate_per_sec": 6377770.0,
+                "bytes_sent_rate_per_sec": 41670.0,
+            }
+            for number in range(4)
+        ],
+        "processlist": [
+            {
+                "key": "pid",
+                "pid": pid,
+                "name": "python",
+                "cmdline": ["python", "-m", "worker", str(pid)],
+                "username": "glances",
+                "status": "S",
+                "cpu_percent": 1.0,
+                "memory_percent": 0.1,
+                "memory_info": {"rss": 1024, "vms": 2048, "shared": 512},
+                "cpu_times": {"user": 1.0, "system": 2.0, "iowait": 0.0},
+                "num_threads": 4,
+                "time_since_update": 1.0,
+            }
+            for pid in range(processes)
+        ],
+        "uptime": "3 days, 10:25:20",
+    }
+
+
+def mock_client(response: dict[str, Any]) -> httpx.AsyncClient:
+    """Create a client which answers every request with the response."""
+    content = json.dumps(response).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=content, headers={"Content-Type": "application/json"}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
@@ -2,15 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from collections.abc import Collection, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from sys import intern
 from typing import Any
 
 import httpx
 
 from . import exceptions
+from .arrays import GpuArrays, PerCpuArrays, gpu_name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sections of the Home Assistant sensor data and the plugins they are built from
+HA_SECTIONS: dict[str, tuple[str, ...]] = {
+    "fs": ("fs",),
+    "sensors": ("sensors",),
+    "mem": ("mem",),
+    "memswap": ("memswap",),
+    "load": ("load",),
+    "processcount": ("processcount",),
+    "cpu": ("quicklook",),
+    "percpu": ("percpu",),
+    "network": ("network",),
+    # Key is "dockers" in Glances 3.3 and before
+    "containers": ("containers", "dockers"),
+    "docker": ("containers", "dockers"),
+    "raid": ("raid",),
+    "uptime": ("uptime",),
+    "gpu": ("gpu",),
+    "diskio": ("diskio",),
+}
+
+# Sections with array representations, only built when requested
+ARRAY_SECTIONS: dict[str, tuple[str, ...]] = {
+    "percpu_array": ("percpu",),
+    "gpu_array": ("gpu",),
+}
+
 
 class Glances:
     """A class for handling the data retrieval."""
@@ -25,6 +57,8 @@ class Glances:
         username: str | None = None,
         password: str | None = None,
         httpx_client: httpx.AsyncClient | None = None,
+        keep_data: bool = True,
+        executor: Executor | None = None,
     ):
         """Initialize the connection."""
         if version == 2:
@@ -36,33 +70,35 @@ class Glances:
         self.url = f"{schema}://{host}:{port}/api/{version}"
         self.data: dict[str, Any] = {}
         self.plugins: list[str] = []
+        self.limits: dict[str, Any] = {}
         self.values: dict[str, Any] | None = None
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
         self.httpx_client = httpx_client
         self.version = version
+        self.keep_data = keep_data
+        self.executor = executor
 
-    async def get_data(self, endpoint: str) -> None:
-        """Retrieve the data."""
-        url = f"{self.url}/{endpoint}"
+    async def _get(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """Send the request with the configured credentials."""
+        if self.password is None:
+            return await client.get(url)
+        if self.username is not None:
+            return await client.get(url, auth=(self.username, self.password))
+        raise ValueError("username and password must be provided.")
 
-        httpx_client = (
-            self.httpx_client
-            if self.httpx_client
-            else httpx.AsyncClient(verify=self.verify_ssl)
-        )
+    async def _fetch(self, endpoint: str) -> bytes:
+        """Retrieve the raw response of an endpoint."""
+        url = f"{self.url}/{endpoint}"
 
         try:
-            async with httpx_client as client:
-                if self.password is None:
-                    response = await client.get(url)
-                elif self.username is not None:
-                    response = await client.get(
-                        url, auth=(self.username, self.password)
-                    )
-                else:
-                    raise ValueError("username and password must be provided.")
+            if self.httpx_client is not None:
+                # A client passed in is owned by the caller and kept open
+                response = await self._get(self.httpx_client, url)
+            else:
+                async with httpx.AsyncClient(verify=self.verify_ssl) as client:
+                    response = await self._get(client, url)
         except (httpx.ConnectError, httpx.TimeoutException) as err:
             raise exceptions.GlancesApiConnectionError(
                 f"Connection to {url} failed"
@@ -77,17 +113,23 @@ class Glances:
             raise exceptions.GlancesApiNoDataAvailable(
                 f"endpoint: '{endpoint}' is not valid"
             )
-        try:
-            _LOGGER.debug(response.json())
-            if endpoint == "all":
-                self.data = response.json()
-            elif endpoint == "pluginslist":
-                self.plugins = response.json()
-        except TypeError as err:
-            _LOGGER.error("Can not load data from Glances")
-            raise exceptions.GlancesApiConnectionError(
-                "Unable to get the data from Glances"
-            ) from err
+        return response.content
+
+    async def _request(self, endpoint: str) -> Any:
+        """Retrieve and decode the response of an endpoint."""
+        data = _decode(await self._fetch(endpoint))
+        _LOGGER.debug(data)
+        return data
+
+    async def get_data(self, endpoint: str) -> None:
+        """Retrieve the data."""
+        data = await self._request(endpoint)
+        if endpoint == "all":
+            self.data = data
+        elif endpoint == "pluginslist":
+            self.plugins = data
+        elif endpoint == "all/limits":
+            self.limits = data
 
     async def get_metrics(self, element: str) -> None:
         """Get all the metrics for a monitored element."""
@@ -99,137 +141,306 @@ class Glances:
         else:
             raise exceptions.GlancesApiError("Element data not available")
 
-    async def get_ha_sensor_data(self) -> dict[str, Any]:
-        """Create a dictionary with data for Home Assistant sensors."""
-        await self.get_data("all")
+    async def _fetch_plugins(self, plugins: Iterable[str]) -> dict[str, bytes]:
+        """Retrieve the raw responses of the given plugins only."""
+        plugins = list(plugins)
+        responses = await asyncio.gather(
+            *map(self._fetch, plugins), return_exceptions=True
+        )
+        contents = {}
+        for plugin, response in zip(plugins, responses):
+            if isinstance(response, exceptions.GlancesApiNoDataAvailable):
+                # The plugin is disabled or not available in this version
+                continue
+            if isinstance(response, BaseException):
+                raise response
+            contents[plugin] = response
+        return contents
+
+    async def get_limits(self) -> dict[str, Any]:
+        """Get the alert limits configured on the Glances server."""
+        await self.get_data("all/limits")
+        return self.limits
+
+    async def get_values(self, paths: Iterable[str]) -> dict[str, Any]:
+        """Get only the given values from the plugins.
+
+        A path is ``plugin.field`` for plugins with a single set of values,
+        e.g. ``mem.percent``, or ``plugin.key.field`` for plugins with a
+        list of items, e.g. ``fs./.percent`` where the key is the value
+        of the item's key field (mount point, interface name, ...).
+        A single field of a plugin is retrieved from its item endpoint,
+        otherwise the plugin is retrieved once for all its paths. Values
+        which are not available are None.
+        """
+        plugins: dict[str, dict[str, tuple[str, str]]] = {}
+        for path in paths:
+            plugin, _, rest = path.partition(".")
+            key, _, field = rest.rpartition(".")
+            if not plugin or not field:
+                raise ValueError(f"path '{path}' must contain a plugin and a field")
+            plugins.setdefault(plugin, {})[path] = (key, field)
+
+        endpoints = []
+        for plugin, selected in plugins.items():
+            (key, field), *others = selected.values()
+            if not key and not others:
+                endpoints.append(f"{plugin}/{field}")
+            else:
+                endpoints.append(plugin)
+        responses = await asyncio.gather(
+            *map(self._request, endpoints), return_exceptions=True
+        )
+
+        values: dict[str, Any] = {}
+        for selected, data in zip(plugins.values(), responses):
+            if isinstance(data, exceptions.GlancesApiNoDataAvailable):
+                # The plugin is disabled or the field is unknown
+                values.update(dict.fromkeys(selected))
+                continue
+            if isinstance(data, BaseException):
+                raise data
+            if isinstance(data, list):
+                data = {str(item.get(item.get("key"))): item for item in data}
+            for path, (key, field) in selected.items():
+                if not isinstance(data, dict):
+                    # Plugins like uptime only provide a single value
+                    values[path] = None
+                    continue
+                item = data.get(key) if key else data
+                values[path] = item.get(field) if isinstance(item, dict) else None
+        return values
+
+    async def get_ha_sensor_data(
+        self, sections: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        """Create a dictionary with data for Home Assistant sensors.
+
+        If ``sections`` is given, only the plugins needed for these sections
+        are retrieved and only these sections are built. The sections of
+        ``ARRAY_SECTIONS`` are only built if requested.
 
-        sensor_data: dict[str, Any] = {}
-
-        if disks := self.data.get("fs"):
-            sensor_data["fs"] = {}
-            for disk in disks:
-                disk_free = disk.get("free") or (disk["size"] - disk["used"])
-                sensor_data["fs"][disk["mnt_point"]] = {
-                    "disk_use": round(disk["used"] / 1024**3, 1),
-                    "disk_use_percent": disk["percent"],
-                    "disk_size": round(disk["size"] / 1024**3, 1),
-                    "disk_free": round(disk_free / 1024**3, 1),
-                }
-        if data := self.data.get("sensors"):
-            sensor_data["sensors"] = {}
-            for sensor in data:
-                sensor_data["sensors"][sensor["label"]] = {
-                    sensor["type"]: sensor["value"]
-                }
-        if data := self.data.get("mem"):
-            sensor_data["mem"] = {
-                "memory_use_percent": data["percent"],
-                "memory_use": round(data["used"] / 1024**2, 1),
-                "memory_free": round(data["free"] / 1024**2, 1),
+        With an executor the responses are decoded and transformed there.
+        With a process pool, ``keep_data`` pickles the whole decoded
+        response back on every poll, so ``keep_data=False`` is recommended.
+        """
+        section_plugins = HA_SECTIONS | ARRAY_SECTIONS
+        if sections is None:
+            sections = HA_SECTIONS.keys()
+        elif unknown := set(sections) - section_plugins.keys():
+            raise ValueError(f"Unknown sections: {', '.join(sorted(unknown))}")
+
+        if set(sections) >= HA_SECTIONS.keys():
+            contents = {"all": await self._fetch("all")}
+        else:
+            plugins = {
+                plugin for section in sections for plugin in section_plugins[section]
             }
-        if data := self.data.get("memswap"):
-            sensor_data["memswap"] = {
-                "swap_use_percent": data["percent"],
-                "swap_use": round(data["used"] / 1024**3, 1),
-                "swap_free": round(data["free"] / 1024**3, 1),
+            if self.version > 3:
+                plugins.discard("dockers")
+            contents = await self._fetch_plugins(plugins)
+
+        args = (contents, self.version, frozenset(sections), self.keep_data)
+        if self.executor is None:
+            sensor_data, self.data = _decode_ha_sensor_data(*args)
+        else:
+            # The result of a process pool is pickled, including the decoded
+            # data unless keep_data is False
+            loop = asyncio.get_running_loop()
+            sensor_data, self.data = await loop.run_in_executor(
+                self.executor, _decode_ha_sensor_data, *args
+            )
+            if isinstance(self.executor, ProcessPoolExecutor):
+                # Names unpickled from another process are new strings
+                _intern_names(sensor_data)
+        return sensor_data
+
+
+def _decode(content: bytes) -> Any:
+    """Decode the raw response of an endpoint."""
+    try:
+        return json.loads(content)
+    except TypeError as err:
+        _LOGGER.error("Can not load data from Glances")
+        raise exceptions.GlancesApiConnectionError(
+            "Unable to get the data from Glances"
+        ) from err
+
+
+def _decode_ha_sensor_data(
+    contents: dict[str, bytes], version: int, sections: frozenset[str], keep: bool
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Decode the raw responses and create the data for Home Assistant sensors.
+
+    ``contents`` holds the response of the "all" endpoint or of single
+    plugins. This runs in an executor if one is configured, so arguments
+    and the result must be picklable. The decoded data is only returned
+    if it should be kept.
+    """
+    if "all" in contents:
+        stats = _decode(contents["all"])
+    else:
+        stats = {plugin: _decode(content) for plugin, content in contents.items()}
+    _LOGGER.debug(stats)
+    sensor_data = _build_ha_sensor_data(stats, version, sections)
+    return sensor_data, stats if keep else {}
+
+
+def _intern_names(sensor_data: dict[str, Any]) -> None:
+    """Intern the names used as keys in the sensor data."""
+    for section in ("fs", "percpu", "network", "containers", "gpu", "diskio"):
+        if section in sensor_data:
+            sensor_data[section] = {
+                intern(name): values for name, values in sensor_data[section].items()
             }
-        if data := self.data.get("load"):
-            sensor_data["load"] = {
-                "processor_load": data.get("min15"),
-                "processor_load_1m": data.get("min1"),
-                "processor_load_5m": data.get("min5"),
+    if "sensors" in sensor_data:
+        sensor_data["sensors"] = {
+            intern(label): {intern(kind): value for kind, value in values.items()}
+            for label, values in sensor_data["sensors"].items()
+        }
+    for section in ARRAY_SECTIONS:
+        if section in sensor_data:
+            arrays = sensor_data[section]
+            arrays.index = {intern(name): pos for name, pos in arrays.index.items()}
+
+
+def _build_ha_sensor_data(
+    stats: dict[str, Any], version: int, sections: frozenset[str]
+) -> dict[str, Any]:
+    """Create a dictionary with data for Home Assistant sensors."""
+    sensor_data: dict[str, Any] = {}
+
+    if "fs" in sections and (disks := stats.get("fs")):
+        sensor_data["fs"] = {}
+        for disk in disks:
+            disk_free = disk.get("free") or (disk["size"] - disk["used"])
+            sensor_data["fs"][intern(disk["mnt_point"])] = {
+                "disk_use": round(disk["used"] / 1024**3, 1),
+                "disk_use_percent": disk["percent"],
+                "disk_size": round(disk["size"] / 1024**3, 1),
+                "disk_free": round(disk_free / 1024**3, 1),
             }
-        if data := self.data.get("processcount"):
-            sensor_data["processcount"] = {
-                "process_running": data["running"],
-                "process_total": data["total"],
-                "process_thread": data["thread"],
-                "process_sleeping": data["sleeping"],
+    if "sensors" in sections and (data := stats.get("sensors")):
+        sensor_data["sensors"] = {}
+        for sensor in data:
+            sensor_data["sensors"][intern(sensor["label"])] = {
+                intern(sensor["type"]): sensor["value"]
             }
-        if data := self.data.get("quicklook"):
-            sensor_data["cpu"] = {"cpu_use_percent": data["cpu"]}
-        if data := self.data.get("percpu"):
-            sensor_data["percpu"] = {}
-            for cpu in data:
-                sensor_data["percpu"][str(cpu["cpu_number"])] = {
-                    "cpu_use_percent": cpu["total"]
-                }
-        if networks := self.data.get("network"):
-            sensor_data["network"] = {}
-            for network in networks:
-                rx = tx = None
-                if self.version <= 3:
-                    time_since_update = network["time_since_update"]
-                    if (rx_bytes := network.get("rx")) is not None:
-                        rx = round(rx_bytes / time_since_update)
-                    if (tx_bytes := network.get("tx")) is not None:
-                        tx = round(tx_bytes / time_since_update)
-                else:
-                    # New network sensors in Glances v4
-                    rx = network.get("bytes_recv_rate_per_sec")
-                    tx = network.get("bytes_sent_rate_per_sec")
-                sensor_data["network"][network["interface_name"]] = {
-                    "is_up": network.get("is_up"),
-                    "rx": rx,
-                    "tx": tx,
-                    "speed": round(network["speed"] / 1024**3, 1),
-                }
-        containers_data = None
-        if self.version <= 3:
-            # Glances v3 and earlier provide a dict, with containers inside a list in this dict
-            # Key is "dockers" in 3.3 and before, and "containers" in 3.4
-            data = self.data.get("dockers") or self.data.get("containers")
-            containers_data = data.get("containers") if data else None
-        else:
-            # Glances v4 provides a list of containers
-            containers_data = self.data.get("containers")
-        if containers_data:
-            sensor_data["containers"] = {}
-            active_containers = [
-                container
-                for container in containers_data
-                # "status" since Glance v4, "Status" in v3 and earlier
-                # "healthy" status added to Glances 4.5 (see issue #50)
-                if container.get("status") == "running"
-                or container.get("Status") == "running"
-                or container.get("status") == "healthy"
-                or container.get("Status") == "healthy"
-            ]
-            sensor_data["docker"] = {"docker_active": len(active_containers)}
-            cpu_use = 0.0
-            for container in active_containers:
-                cpu_use += container["cpu"].get("total", 0)
-            sensor_data["docker"]["docker_cpu_use"] = round(cpu_use, 1)
-            mem_use = 0.0
-            for container in active_containers:
-                mem_use += container["memory"].get("usage", 0)
-            sensor_data["docker"]["docker_memory_use"] = round(mem_use / 1024**2, 1)
-            for container in active_containers:
-                sensor_data["containers"][container["name"]] = {
-                    "container_cpu_use": round(container["cpu"].get("total", 0), 1),
-                    "container_memory_use": round(
-                        container["memory"].get("usage", 0) / 1024**2, 1
-                    ),
-                }
-        if data := self.data.get("raid"):
-            sensor_data["raid"] = data
-        if data := self.data.get("uptime"):
-            sensor_data["uptime"] = data
-        if data := self.data.get("gpu"):
-            sensor_data["gpu"] = {}
-            for sensor in data:
-                sensor_data["gpu"][f"{sensor['name']} (GPU {sensor['gpu_id']})"] = {
-                    "temperature": sensor.get("temperature", 0),
-                    "mem": sensor.get("mem", 0),
-                    "proc": sensor.get("proc", 0),
-                    "fan_speed": sensor.get("fan_speed", 0),
-                }
-        if data := self.data.get("diskio"):
-            sensor_data["diskio"] = {}
-            for disk in data:
-                time_since_update = disk["time_since_update"]
-                sensor_data["diskio"][disk["disk_name"]] = {
-                    "read": round(disk["read_bytes"] / time_since_update),
-                    "write": round(disk["write_bytes"] / time_since_update),
-                }
-        return sensor_data
+    if "mem" in sections and (data := stats.get("mem")):
+        sensor_data["mem"] = {
+            "memory_use_percent": data["percent"],
+            "memory_use": round(data["used"] / 1024**2, 1),
+            "memory_free": round(data["free"] / 1024**2, 1),
+        }
+    if "memswap" in sections and (data := stats.get("memswap")):
+        sensor_data["memswap"] = {
+            "swap_use_percent": data["percent"],
+            "swap_use": round(data["used"] / 1024**3, 1),
+            "swap_free": round(data["free"] / 1024**3, 1),
+        }
+    if "load" in sections and (data := stats.get("load")):
+        sensor_data["load"] = {
+            "processor_load": data.get("min15"),
+            "processor_load_1m": data.get("min1"),
+            "processor_load_5m": data.get("min5"),
+        }
+    if "processcount" in sections and (data := stats.get("processcount")):
+        sensor_data["processcount"] = {
+            "process_running": data["running"],
+            "process_total": data["total"],
+            "process_thread": data["thread"],
+            "process_sleeping": data["sleeping"],
+        }
+    if "cpu" in sections and (data := stats.get("quicklook")):
+        sensor_data["cpu"] = {"cpu_use_percent": data["cpu"]}
+    if "percpu" in sections and (data := stats.get("percpu")):
+        sensor_data["percpu"] = {}
+        for cpu in data:
+            sensor_data["percpu"][intern(str(cpu["cpu_number"]))] = {
+                "cpu_use_percent": cpu["total"]
+            }
+    if "network" in sections and (networks := stats.get("network")):
+        sensor_data["network"] = {}
+        for network in networks:
+            rx = tx = None
+            if version <= 3:
+                time_since_update = network["time_since_update"]
+                if (rx_bytes := network.get("rx")) is not None:
+                    rx = round(rx_bytes / time_since_update)
+                if (tx_bytes := network.get("tx")) is not None:
+                    tx = round(tx_bytes / time_since_update)
+            else:
+                # New network sensors in Glances v4
+                rx = network.get("bytes_recv_rate_per_sec")
+                tx = network.get("bytes_sent_rate_per_sec")
+            sensor_data["network"][intern(network["interface_name"])] = {
+                "is_up": network.get("is_up"),
+                "rx": rx,
+                "tx": tx,
+                "speed": round(network["speed"] / 1024**3, 1),
+            }
+    containers_data = None
+    if version <= 3:
+        # Glances v3 and earlier provide a dict, with containers inside a list in this dict
+        # Key is "dockers" in 3.3 and before, and "containers" in 3.4
+        data = stats.get("dockers") or stats.get("containers")
+        containers_data = data.get("containers") if data else None
+    else:
+        # Glances v4 provides a list of containers
+        containers_data = stats.get("containers")
+    if containers_data and ("containers" in sections or "docker" in sections):
+        active_containers = [
+            container
+            for container in containers_data
+            # "status" since Glance v4, "Status" in v3 and earlier
+            # "healthy" status added to Glances 4.5 (see issue #50)
+            if container.get("status") == "running"
+            or container.get("Status") == "running"
+            or container.get("status") == "healthy"
+            or container.get("Status") == "healthy"
+        ]
+    if containers_data and "docker" in sections:
+        sensor_data["docker"] = {"docker_active": len(active_containers)}
+        cpu_use = 0.0
+        for container in active_containers:
+            cpu_use += container["cpu"].get("total", 0)
+        sensor_data["docker"]["docker_cpu_use"] = round(cpu_use, 1)
+        mem_use = 0.0
+        for container in active_containers:
+            mem_use += container["memory"].get("usage", 0)
+        sensor_data["docker"]["docker_memory_use"] = round(mem_use / 1024**2, 1)
+    if containers_data and "containers" in sections:
+        sensor_data["containers"] = {}
+        for container in active_containers:
+            sensor_data["containers"][intern(container["name"])] = {
+                "container_cpu_use": round(container["cpu"].get("total", 0), 1),
+                "container_memory_use": round(
+                    container["memory"].get("usage", 0) / 1024**2, 1
+                ),
+            }
+    if "raid" in sections and (data := stats.get("raid")):
+        sensor_data["raid"] = data
+    if "uptime" in sections and (data := stats.get("uptime")):
+        sensor_data["uptime"] = data
+    if "gpu" in sections and (data := stats.get("gpu")):
+        sensor_data["gpu"] = {}
+        for sensor in data:
+            sensor_data["gpu"][gpu_name(sensor)] = {
+                "temperature": sensor.get("temperature", 0),
+                "mem": sensor.get("mem", 0),
+                "proc": sensor.get("proc", 0),
+                "fan_speed": sensor.get("fan_speed", 0),
+            }
+    if "diskio" in sections and (data := stats.get("diskio")):
+        sensor_data["diskio"] = {}
+        for disk in data:
+            time_since_update = disk["time_since_update"]
+            sensor_data["diskio"][intern(disk["disk_name"])] = {
+                "read": round(disk["read_bytes"] / time_since_update),
+                "write": round(disk["write_bytes"] / time_since_update),
+            }
+    if "percpu_array" in sections and (data := stats.get("percpu")):
+        sensor_data["percpu_array"] = PerCpuArrays.from_data(data)
+    if "gpu_array" in sections and (data := stats.get("gpu")):
+        sensor_data["gpu_array"] = GpuArrays.from_data(data)
+    return sensor_data
@@ -0,0 +1,214 @@
+"""Threshold and alert evaluation for Glances sensor data."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+WILDCARD = "*"
+
+# Glances limit names and the sensor paths they apply to
+_LIMIT_PATHS: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    "fs": ("fs", "fs_{level}", ("fs", WILDCARD, "disk_use_percent")),
+    "mem": ("mem", "mem_{level}", ("mem", "memory_use_percent")),
+    "memswap": ("memswap", "memswap_{level}", ("memswap", "swap_use_percent")),
+    "cpu": ("cpu", "cpu_total_{level}", ("cpu", "cpu_use_percent")),
+    "load": ("load", "load_{level}", ("load", "processor_load")),
+}
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """A threshold rule for a sensor path.
+
+    The path addresses a value in the output of ``get_ha_sensor_data``,
+    e.g. ``("fs", "*", "disk_use_percent")`` where ``*`` matches every
+    key on that level. The alert fires when the value is above (or below)
+    ``threshold`` and clears once it has fallen back past ``clear``.
+    Both transitions need ``delay`` consecutive evaluations.
+    """
+
+    name: str
+    path: tuple[str, ...]
+    threshold: float
+    clear: float | None = None
+    above: bool = True
+    delay: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the rule."""
+        if len(self.path) < 2:
+            raise ValueError("path must contain a section and a value")
+        if self.delay < 1:
+            raise ValueError("delay must be at least 1")
+        if self.clear is not None and (
+            self.clear > self.threshold if self.above else self.clear < self.threshold
+        ):
+            raise ValueError("clear must not be beyond the threshold")
+
+    def triggers(self, value: float) -> bool:
+        """Return True if the value is beyond the threshold."""
+        return value > self.threshold if self.above else value < self.threshold
+
+    def clears(self, value: float) -> bool:
+        """Return True if the value is back within the clear threshold."""
+        clear = self.threshold if self.clear is None else self.clear
+        return value <= clear if self.above else value >= clear
+
+
+@dataclass(frozen=True)
+class AlertEvent:
+    """A change of the state of an alert."""
+
+    rule: AlertRule
+    path: tuple[str, ...]
+    value: Any
+    active: bool
+
+
+@dataclass
+class _AlertState:
+    """State of a rule for a single resolved path."""
+
+    active: bool = False
+    count: int = 0
+    value: Any = None
+
+
+@dataclass
+class _CompiledRule:
+    """Rule with its state per resolved path."""
+
+    rule: AlertRule
+    states: dict[tuple[str, ...], _AlertState] = field(default_factory=dict)
+
+
+def rules_from_limits(
+    limits: Mapping[str, Any],
+    level: str = "critical",
+    cores: int | None = None,
+    hysteresis: float = 0.0,
+    delay: int = 1,
+) -> list[AlertRule]:
+    """Create rules from the limits of a Glances server.
+
+    ``limits`` is the response of the ``all/limits`` endpoint and ``level``
+    one of ``careful``, ``warning`` or ``critical``. Glances defines the
+    load limits per core, so the load rule is only created if ``cores``
+    is given.
+    """
+    rules = []
+    for name, (plugin, key, path) in _LIMIT_PATHS.items():
+        if (threshold := limits.get(plugin, {}).get(key.format(level=level))) is None:
+            continue
+        if name == "load":
+            if cores is None:
+                continue
+            threshold *= cores
+        rules.append(
+            AlertRule(
+                name=f"{name}_{level}",
+                path=path,
+                threshold=threshold,
+                clear=threshold - hysteresis,
+                delay=delay,
+            )
+        )
+    return rules
+
+
+class AlertEngine:
+    """Evaluate alert rules against consecutive sensor data snapshots.
+
+    The engine keeps the last value of every path a rule resolves to and
+    not a reference to the sensor data, so the data may be built anew or
+    updated in place between evaluations. Values are expected to be
+    numbers; containers updated in place are not supported.
+    """
+
+    def __init__(self, rules: Iterable[AlertRule]) -> None:
+        """Compile the rules by the section they apply to."""
+        self._sections: dict[str, list[_CompiledRule]] = {}
+        for rule in rules:
+            self._sections.setdefault(rule.path[0], []).append(_CompiledRule(rule))
+
+    @property
+    def active(self) -> list[AlertEvent]:
+        """Return the alerts that are currently active."""
+        return [
+            AlertEvent(compiled.rule, path, state.value, True)
+            for compiled_rules in self._sections.values()
+            for compiled in compiled_rules
+            for path, state in compiled.states.items()
+            if state.active
+        ]
+
+    def evaluate(self, sensor_data: Mapping[str, Any]) -> list[AlertEvent]:
+        """Evaluate the rules and return the alerts which changed state.
+
+        Only the values the rules point to are looked at, and only those
+        which changed since the last evaluation or are waiting for their
+        delay to pass are checked against the thresholds.
+        """
+        events: list[AlertEvent] = []
+        for section, compiled_rules in self._sections.items():
+            data = sensor_data.get(section)
+            for compiled in compiled_rules:
+                self._evaluate_rule(compiled, data, events)
+        return events
+
+    def _evaluate_rule(
+        self,
+        compiled: _CompiledRule,
+        data: Any,
+        events: list[AlertEvent],
+    ) -> None:
+        """Evaluate a single rule against the data of its section."""
+        rule = compiled.rule
+        seen = set()
+        for path, value in _resolve(rule.path, 1, data):
+            seen.add(path)
+            state = compiled.states.get(path)
+            if state is None:
+                state = compiled.states[path] = _AlertState()
+            elif value == state.value and not state.count:
+                continue
+            state.value = value
+            if not isinstance(value, (int, float)):
+                # A missing sample interrupts the consecutive evaluations
+                state.count = 0
+                continue
+            transition = rule.clears(value) if state.active else rule.triggers(value)
+            if not transition:
+                state.count = 0
+                continue
+            state.count += 1
+            if state.count >= rule.delay:
+                state.active = not state.active
+                state.count = 0
+                events.append(AlertEvent(rule, path, value, state.active))
+
+        if len(seen) == len(compiled.states):
+            return
+        for path in compiled.states.keys() - seen:
+            state = compiled.states.pop(path)
+            if state.active:
+                events.append(AlertEvent(rule, path, None, False))
+
+
+def _resolve(
+    path: tuple[str, ...], index: int, data: Any
+) -> Iterable[tuple[tuple[str, ...], Any]]:
+    """Yield the concrete paths and their values."""
+    if index == len(path):
+        yield path, data
+        return
+    if not isinstance(data, Mapping):
+        return
+    if (key := path[index]) == WILDCARD:
+        for key, value in data.items():
+            concrete = (*path[:index], key, *path[index + 1 :])
+            yield from _resolve(concrete, index + 1, value)
+    elif key in data:
+        yield from _resolve(path, index + 1, data[key])
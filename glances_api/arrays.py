@@ -0,0 +1,78 @@
+"""Array representation of per-core CPU and GPU data."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from sys import intern
+from typing import Any
+
+_NAN = float("nan")
+
+
+def gpu_name(gpu: dict[str, Any]) -> str:
+    """Return the key of a GPU in the gpu section and the GPU arrays."""
+    return intern(f"{gpu['name']} (GPU {gpu['gpu_id']})")
+
+
+def _zeros(length: int) -> array[float]:
+    """Create an array of doubles with the given length."""
+    return array("d", bytes(8 * length))
+
+
+def _value(item: dict[str, Any], key: str) -> float:
+    """Return a value as float or NaN if it is not available."""
+    value = item.get(key)
+    return _NAN if value is None else float(value)
+
+
+@dataclass
+class PerCpuArrays:
+    """Per-core CPU usage as contiguous arrays.
+
+    ``index`` maps the CPU number, as used as key of the ``percpu``
+    section, to the position in the arrays.
+    """
+
+    index: dict[str, int]
+    total: array[float]
+    user: array[float]
+    system: array[float]
+    iowait: array[float]
+
+    @classmethod
+    def from_data(cls, data: list[dict[str, Any]]) -> PerCpuArrays:
+        """Create the arrays from the data of the percpu plugin."""
+        arrays = cls({}, *(_zeros(len(data)) for _ in range(4)))
+        for position, cpu in enumerate(data):
+            arrays.index[intern(str(cpu["cpu_number"]))] = position
+            arrays.total[position] = _value(cpu, "total")
+            arrays.user[position] = _value(cpu, "user")
+            arrays.system[position] = _value(cpu, "system")
+            arrays.iowait[position] = _value(cpu, "iowait")
+        return arrays
+
+
+@dataclass
+class GpuArrays:
+    """GPU usage as contiguous arrays.
+
+    ``index`` maps the GPU name, as used as key of the ``gpu`` section,
+    to the position in the arrays.
+    """
+
+    index: dict[str, int]
+    temperature: array[float]
+    mem: array[float]
+    proc: array[float]
+
+    @classmethod
+    def from_data(cls, data: list[dict[str, Any]]) -> GpuArrays:
+        """Create the arrays from the data of the gpu plugin."""
+        arrays = cls({}, *(_zeros(len(data)) for _ in range(3)))
+        for position, gpu in enumerate(data):
+            arrays.index[gpu_name(gpu)] = position
+            arrays.temperature[position] = _value(gpu, "temperature")
+            arrays.mem[position] = _value(gpu, "mem")
+            arrays.proc[position] = _value(gpu, "proc")
+        return arrays
@@ -0,0 +1,153 @@
+"""Synchronous access to the Glances API."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Collection, Coroutine, Iterable
+from functools import partial
+from typing import Any, Self, TypeVar
+
+import httpx
+
+from . import Glances
+
+_T = TypeVar("_T")
+
+
+class GlancesSync:
+    """Run Glances clients from synchronous code.
+
+    All requests are executed on a single event loop running in a
+    background thread and share one connection pool. The methods can be
+    called from any number of threads at once.
+    """
+
+    def __init__(
+        self,
+        verify_ssl: bool = True,
+        limits: httpx.Limits | None = None,
+    ) -> None:
+        """Start the event loop and create the connection pool."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="glances-api", daemon=True
+        )
+        self._thread.start()
+        self._client = httpx.AsyncClient(
+            verify=verify_ssl, limits=limits or httpx.Limits()
+        )
+        # Guards submitting work against closing the client
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pending: set[concurrent.futures.Future[Any]] = set()
+        # Only used on the event loop thread
+        self._locks: weakref.WeakKeyDictionary[Glances, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the connection pool and stop the event loop."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection pool and stop the event loop.
+
+        Calls still pending in other threads are cancelled.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Cannot be called from the event loop of the client")
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def glances(self, **kwargs: Any) -> Glances:
+        """Create a client for a host which uses the shared connection pool."""
+        return Glances(httpx_client=self._client, **kwargs)
+
+    def get_metrics(self, api: Glances, element: str) -> Any:
+        """Get all the metrics for a monitored element."""
+
+        async def get_metrics() -> Any:
+            await api.get_metrics(element)
+            return api.values
+
+        return self._run(self._call(api, get_metrics))
+
+    def get_limits(self, api: Glances) -> dict[str, Any]:
+        """Get the alert limits configured on the Glances server."""
+        return self._run(self._call(api, api.get_limits))
+
+    def get_values(self, api: Glances, paths: Iterable[str]) -> dict[str, Any]:
+        """Get only the given values from the plugins."""
+        return self._run(self._call(api, partial(api.get_values, paths)))
+
+    def get_ha_sensor_data(
+        self, api: Glances, sections: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        """Create a dictionary with data for Home Assistant sensors."""
+        return self._run(self._call(api, partial(api.get_ha_sensor_data, sections)))
+
+    def get_ha_sensor_data_batch(
+        self,
+        apis: Iterable[Glances],
+        sections: Collection[str] | None = None,
+        return_exceptions: bool = True,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Get the data for Home Assistant sensors from many hosts at once.
+
+        The results are in the order of the clients. A host which fails
+        returns its exception unless ``return_exceptions`` is False, in
+        which case the first exception is raised.
+        """
+
+        async def gather() -> list[dict[str, Any] | BaseException]:
+            return await asyncio.gather(
+                *(
+                    self._call(api, partial(api.get_ha_sensor_data, sections))
+                    for api in apis
+                ),
+                return_exceptions=return_exceptions,
+            )
+
+        return self._run(gather())
+
+    async def _call(self, api: Glances, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Call a client, one call per client at a time."""
+        if (lock := self._locks.get(api)) is None:
+            lock = self._locks[api] = asyncio.Lock()
+        async with lock:
+            return await func()
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the event loop and wait for the result."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot be called from the event loop of the client")
+        with self._lock:
+            if self._closed:
+                coro.close()
+                raise RuntimeError("The client is closed")
+            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future.result()
+
+    def _done(self, future: concurrent.futures.Future[Any]) -> None:
+        """Forget a call which is done."""
+        with self._lock:
+            self._pending.discard(future)
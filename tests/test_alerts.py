@@ -0,0 +1,129 @@
+"""Test the evaluation of alerts."""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from glances_api import Glances
+from glances_api.alerts import AlertEngine, AlertRule, rules_from_limits
+
+LIMITS_RESPONSE = {
+    "fs": {"fs_careful": 50.0, "fs_warning": 70.0, "fs_critical": 90.0},
+    "mem": {"mem_careful": 50.0, "mem_warning": 70.0, "mem_critical": 90.0},
+    "load": {"load_careful": 0.7, "load_warning": 1.0, "load_critical": 5.0},
+}
+
+
+def fs_data(**usage: float) -> dict:
+    """Create sensor data with the given disk usage per mount point."""
+    return {
+        "fs": {mnt: {"disk_use_percent": percent} for mnt, percent in usage.items()}
+    }
+
+
+def test_alert_with_hysteresis() -> None:
+    """Test that an alert only clears below the clear threshold."""
+    rule = AlertRule("disk", ("fs", "*", "disk_use_percent"), threshold=90, clear=85)
+    engine = AlertEngine([rule])
+
+    assert engine.evaluate(fs_data(root=50, media=60)) == []
+
+    events = engine.evaluate(fs_data(root=95, media=60))
+    assert [(e.path, e.active) for e in events] == [
+        (("fs", "root", "disk_use_percent"), True)
+    ]
+    assert engine.evaluate(fs_data(root=88, media=60)) == []
+    assert len(engine.active) == 1
+
+    events = engine.evaluate(fs_data(root=80, media=60))
+    assert [(e.path, e.active) for e in events] == [
+        (("fs", "root", "disk_use_percent"), False)
+    ]
+    assert engine.active == []
+
+
+def test_alert_with_delay() -> None:
+    """Test that an alert needs consecutive evaluations to fire."""
+    rule = AlertRule("mem", ("mem", "memory_use_percent"), threshold=90, delay=3)
+    engine = AlertEngine([rule])
+    data = {"mem": {"memory_use_percent": 95}}
+
+    assert engine.evaluate(data) == []
+    assert engine.evaluate({"mem": {"memory_use_percent": 50}}) == []
+    assert engine.evaluate(data) == []
+    # Unchanged data still counts towards the delay
+    assert engine.evaluate(data) == []
+    events = engine.evaluate(data)
+    assert len(events) == 1
+    assert events[0].active
+    assert events[0].value == 95
+
+
+def test_alert_for_removed_sensor() -> None:
+    """Test that an alert clears when the sensor disappears."""
+    rule = AlertRule("disk", ("fs", "*", "disk_use_percent"), threshold=90)
+    engine = AlertEngine([rule])
+
+    engine.evaluate(fs_data(usb=95))
+    events = engine.evaluate({})
+
+    assert len(events) == 1
+    assert not events[0].active
+    assert events[0].value is None
+
+
+def test_invalid_rule() -> None:
+    """Test that a clear threshold beyond the threshold is rejected."""
+    with pytest.raises(ValueError):
+        AlertRule("mem", ("mem", "memory_use_percent"), threshold=90, clear=95)
+
+
+def test_rules_from_limits() -> None:
+    """Test the creation of rules from the Glances limits."""
+    rules = rules_from_limits(LIMITS_RESPONSE, level="warning", cores=4)
+
+    assert {rule.name: (rule.path, rule.threshold) for rule in rules} == {
+        "fs_warning": (("fs", "*", "disk_use_percent"), 70.0),
+        "mem_warning": (("mem", "memory_use_percent"), 70.0),
+        "load_warning": (("load", "processor_load"), 4.0),
+    }
+    assert "load_critical" not in [rule.name for rule in rules_from_limits(LIMITS_RESPONSE)]
+
+
+@pytest.mark.asyncio
+async def test_get_limits(httpx_mock: HTTPXMock) -> None:
+    """Test the retrieval of the limits."""
+    httpx_mock.add_response(
+        url="http://localhost:61208/api/4/all/limits", json=LIMITS_RESPONSE
+    )
+
+    client = Glances(version=4)
+    limits = await client.get_limits()
+
+    assert limits == LIMITS_RESPONSE
+
+
+def test_alert_with_data_updated_in_place() -> None:
+    """Test that sensor data updated in place is evaluated."""
+    rule = AlertRule("mem", ("mem", "memory_use_percent"), threshold=90)
+    engine = AlertEngine([rule])
+    data = {"mem": {"memory_use_percent": 50}}
+
+    assert engine.evaluate(data) == []
+    data["mem"]["memory_use_percent"] = 95
+    events = engine.evaluate(data)
+
+    assert len(events) == 1
+    assert events[0].active
+
+
+def test_alert_delay_with_missing_value() -> None:
+    """Test that a missing value resets the delay."""
+    rule = AlertRule("load", ("load", "processor_load"), threshold=4, delay=2)
+    engine = AlertEngine([rule])
+
+    assert engine.evaluate({"load": {"processor_load": 5}}) == []
+    assert engine.evaluate({"load": {"processor_load": None}}) == []
+    assert engine.evaluate({"load": {"processor_load": 6}}) == []
+    events = engine.evaluate({"load": {"processor_load": 6}})
+    assert len(events) == 1
+    assert events[0].active
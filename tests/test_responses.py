@@ -1,11 +1,13 @@
 """Test the interaction with the Glances API."""
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
 import pytest
 from pytest_httpx import HTTPXMock
 
-from glances_api import Glances
+import glances_api
+from glances_api import HA_SECTIONS, Glances
 from glances_api.exceptions import GlancesApiNoDataAvailable
 
 PLUGINS_LIST_RESPONSE = [
@@ -478,3 +480,176 @@ async def test_ha_sensor_data_with_incomplete_container_information(
     result = await client.get_ha_sensor_data()
 
     assert result == ha_sensor_data
+
+
+@pytest.mark.asyncio
+async def test_get_values(httpx_mock: HTTPXMock) -> None:
+    """Test the retrieval of single values."""
+    httpx_mock.add_response(
+        url="http://localhost:61208/api/4/mem/percent", json={"percent": 27.6}
+    )
+    httpx_mock.add_response(url="http://localhost:61208/api/4/fs", json=RESPONSE["fs"])
+
+    client = Glances(version=4)
+    result = await client.get_values(
+        ["mem.percent", "fs./ssl.percent", "fs./media.used", "fs./usb.used"]
+    )
+
+    assert result == {
+        "mem.percent": 27.6,
+        "fs./ssl.percent": 6.7,
+        "fs./media.used": 32910458880,
+        "fs./usb.used": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_ha_sensor_data_sections(httpx_mock: HTTPXMock) -> None:
+    """Test that only the plugins for the given sections are retrieved."""
+    httpx_mock.add_response(
+        url="http://localhost:61208/api/3/mem", json=RESPONSE["mem"]
+    )
+    httpx_mock.add_response(
+        url="http://localhost:61208/api/3/containers", json=RESPONSE["containers"]
+    )
+    httpx_mock.add_response(
+        url="http://localhost:61208/api/3/dockers", status_code=404
+    )
+
+    client = Glances()
+    result = await client.get_ha_sensor_data(["mem", "docker"])
+
+    assert result == {
+        "mem": HA_SENSOR_DATA["mem"],
+        "docker": HA_SENSOR_DATA["docker"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_ha_sensor_data_unknown_section() -> None:
+    """Test that an unknown section is rejected."""
+    client = Glances()
+    with pytest.raises(ValueError):
+        await client.get_ha_sensor_data(["cpu", "temperature"])
+
+
+@pytest.mark.asyncio
+async def test_ha_sensor_data_arrays(httpx_mock: HTTPXMock) -> None:
+    """Test the array representation of the per-core CPU and GPU data."""
+    httpx_mock.add_response(json=RESPONSE)
+
+    client = Glances()
+    result = await client.get_ha_sensor_data(
+        [*HA_SECTIONS, "percpu_array", "gpu_array"]
+    )
+
+    percpu = result.pop("percpu_array")
+    gpu = result.pop("gpu_array")
+    assert result == HA_SENSOR_DATA
+    assert percpu.index == {"0": 0, "1": 1}
+    assert percpu.total.tolist() == [22.1, 17.2]
+    assert percpu.iowait.tolist() == [0.2, 0.4]
+    assert gpu.index == {
+        "NVIDIA GeForce RTX 4080 (GPU 0)": 0,
+        "NVIDIA GeForce RTX 3080 (GPU 1)": 1,
+    }
+    assert gpu.temperature.tolist() == [38.0, 51.0]
+    assert gpu.proc.tolist() == [12.0, 26.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+async def test_ha_sensor_data_without_keeping_data(httpx_mock: HTTPXMock) -> None:
+    """Test that the data is dropped and names are shared between clients."""
+    httpx_mock.add_response(json=RESPONSE)
+
+    client1 = Glances(keep_data=False)
+    client2 = Glances(host="other", keep_data=False)
+    result1 = await client1.get_ha_sensor_data()
+    result2 = await client2.get_ha_sensor_data()
+
+    assert result1 == HA_SENSOR_DATA
+    assert not client1.data
+    for section in ("network", "gpu"):
+        for name1, name2 in zip(result1[section], result2[section]):
+            assert name1 is name2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_ha_sensor_data_in_executor(
+    httpx_mock: HTTPXMock, executor_class: type[Executor]
+) -> None:
+    """Test the decoding and transformation in an executor."""
+    httpx_mock.add_response(json=RESPONSE)
+    httpx_mock.add_response(json=RESPONSE)
+
+    with executor_class(max_workers=1) as executor:
+        client1 = Glances(executor=executor, keep_data=False)
+        client2 = Glances(host="other", executor=executor)
+        result1 = await client1.get_ha_sensor_data(
+            [*HA_SECTIONS, "percpu_array", "gpu_array"]
+        )
+        result2 = await client2.get_ha_sensor_data(
+            [*HA_SECTIONS, "percpu_array", "gpu_array"]
+        )
+
+    assert {**result1, "percpu_array": None, "gpu_array": None} == {
+        **HA_SENSOR_DATA,
+        "percpu_array": None,
+        "gpu_array": None,
+    }
+    assert not client1.data
+    assert client2.data == RESPONSE
+    for section in ("fs", "sensors", "network", "percpu", "gpu", "diskio"):
+        for name1, name2 in zip(result1[section], result2[section]):
+            assert name1 is name2
+    for section in ("percpu_array", "gpu_array"):
+        for name1, name2 in zip(result1[section].index, result2[section].index):
+            assert name1 is name2
+
+
+@pytest.mark.asyncio
+async def test_get_values_with_unavailable_plugin(httpx_mock: HTTPXMock) -> None:
+    """Test that the values of an unavailable plugin are None."""
+    httpx_mock.add_response(url="http://localhost:61208/api/4/mem", status_code=404)
+    httpx_mock.add_response(
+        url="http://localhost:61208/api/4/load/min5", json={"min5": 0.6}
+    )
+
+    client = Glances(version=4)
+    result = await client.get_values(["mem.percent", "mem.used", "load.min5"])
+
+    assert result == {"mem.percent": None, "mem.used": None, "load.min5": 0.6}
+
+
+@pytest.mark.asyncio
+async def test_get_values_of_plugin_with_single_value(httpx_mock: HTTPXMock) -> None:
+    """Test that paths into a plugin without fields are None."""
+    httpx_mock.add_response(
+        url="http://localhost:61208/api/4/uptime", json="3 days, 10:25:20"
+    )
+
+    client = Glances(version=4)
+    result = await client.get_values(["uptime.a.b", "uptime.c.d"])
+
+    assert result == {"uptime.a.b": None, "uptime.c.d": None}
+
+
+@pytest.mark.asyncio
+async def test_ha_sensor_data_in_thread_pool_not_reinterned(
+    httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that names from a thread pool are not interned again."""
+    httpx_mock.add_response(json=RESPONSE)
+
+    def fail(sensor_data: dict) -> None:
+        raise AssertionError("names interned again")
+
+    monkeypatch.setattr(glances_api, "_intern_names", fail)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        client = Glances(executor=executor)
+        result = await client.get_ha_sensor_data()
+
+    assert result == HA_SENSOR_DATA
@@ -0,0 +1,75 @@
+"""Test the synchronous client."""
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from glances_api.exceptions import GlancesApiNoDataAvailable
+from glances_api.sync import GlancesSync
+
+from .test_responses import HA_SENSOR_DATA, RESPONSE
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_sync_ha_sensor_data(httpx_mock: HTTPXMock) -> None:
+    """Test the synchronous retrieval from many threads."""
+    httpx_mock.add_response(json=RESPONSE)
+
+    with GlancesSync() as runner:
+        api = runner.glances(version=3)
+        with ThreadPoolExecutor(4) as executor:
+            results = list(
+                executor.map(lambda _: runner.get_ha_sensor_data(api), range(8))
+            )
+
+    assert results == [HA_SENSOR_DATA] * 8
+    assert len(httpx_mock.get_requests()) == 8
+
+
+def test_sync_batch(httpx_mock: HTTPXMock) -> None:
+    """Test the batch retrieval with a failing host."""
+    httpx_mock.add_response(url="http://host1:61208/api/3/all", json=RESPONSE)
+    httpx_mock.add_response(url="http://host2:61208/api/3/all", status_code=400)
+
+    with GlancesSync() as runner:
+        apis = [runner.glances(host="host1"), runner.glances(host="host2")]
+        results = runner.get_ha_sensor_data_batch(apis)
+
+    assert results[0] == HA_SENSOR_DATA
+    assert isinstance(results[1], GlancesApiNoDataAvailable)
+
+
+def test_sync_closed() -> None:
+    """Test that a closed client can not be used."""
+    runner = GlancesSync()
+    api = runner.glances()
+    runner.close()
+
+    with pytest.raises(RuntimeError):
+        runner.get_ha_sensor_data(api)
+
+
+def test_sync_close_with_pending_call(httpx_mock: HTTPXMock) -> None:
+    """Test that closing cancels a call waiting in another thread."""
+    requested = threading.Event()
+
+    async def slow_response(request: httpx.Request) -> httpx.Response:
+        """Answer after the client is closed."""
+        requested.set()
+        await asyncio.sleep(10)
+        return httpx.Response(200, json=RESPONSE)
+
+    httpx_mock.add_callback(slow_response)
+
+    runner = GlancesSync()
+    api = runner.glances()
+    with ThreadPoolExecutor(1) as executor:
+        future = executor.submit(runner.get_ha_sensor_data, api)
+        assert requested.wait(5)
+        runner.close()
+        with pytest.raises(CancelledError):
+            future.result(timeout=5)